@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from collections.abc import Coroutine
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import frontend, panel_custom
@@ -23,6 +25,8 @@ from homeassistant.core import (
 )
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.event import (
     TrackStates,
     async_track_state_change_filtered,
@@ -58,12 +62,15 @@ from .const import (
     SERVICE_EXCLUDE_LIGHTS,
     SERVICE_FADE_LIGHTS,
     SERVICE_INCLUDE_LIGHTS,
+    SIGNAL_CHECK_UNCONFIGURED,
     STORAGE_KEY,
+    UNCONFIGURED_CHECK_COOLDOWN_S,
     UNCONFIGURED_CHECK_INTERVAL_HOURS,
     VALID_EASING,
 )
 from .coordinator import FadeCoordinator
 from .notifications import _notify_unconfigured_lights
+from .options import FadoOptions
 from .websocket_api import async_register_websocket_api
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -151,6 +158,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         store=store,
         min_step_delay_ms=min_step_delay_ms,
     )
+    coordinator.options = FadoOptions(entry)
     await coordinator.async_load()
 
     hass.data[DOMAIN] = coordinator
@@ -199,6 +207,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     entry.async_on_unload(tracker.async_remove)
 
+    # Startup, registry events and the daily timer all request an unconfigured-lights
+    # check via SIGNAL_CHECK_UNCONFIGURED. A single debounced subscriber does the work,
+    # so a burst of requests (startup, integration reloads) runs one check per burst.
+    async def _async_check_unconfigured() -> None:
+        await _notify_unconfigured_lights(hass)
+
+    unconfigured_debouncer: Debouncer[Coroutine[Any, Any, None]] = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=UNCONFIGURED_CHECK_COOLDOWN_S,
+        immediate=True,
+        function=_async_check_unconfigured,
+    )
+    entry.async_on_unload(unconfigured_debouncer.async_shutdown)
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_CHECK_UNCONFIGURED, unconfigured_debouncer.async_call)
+    )
+
     # Listen for entity registry changes to clean up deleted entities and check for new ones
     async def handle_entity_registry_updated(
         event: Event[er.EventEntityRegistryUpdatedData],
@@ -211,18 +237,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not entity_id.startswith(f"{LIGHT_DOMAIN}."):
             return
 
+        coordinator.registry_revision += 1
+
         if action == "remove":
             await coordinator.cleanup_entity(entity_id)
-            await _notify_unconfigured_lights(hass)
+            async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
             hass.bus.async_fire(EVENT_CONFIG_UPDATED)
         elif action == "create":
-            await _notify_unconfigured_lights(hass)
+            async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
             hass.bus.async_fire(EVENT_CONFIG_UPDATED)
         elif action == "update":
             # Check if light was re-enabled (disabled_by changed)
             changes = event.data.get("changes", {})
             if "disabled_by" in changes:
-                await _notify_unconfigured_lights(hass)
+                async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
                 hass.bus.async_fire(EVENT_CONFIG_UPDATED)
 
     entry.async_on_unload(
@@ -233,9 +261,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Register daily timer to check for unconfigured lights
-    async def _daily_unconfigured_check(_now: datetime) -> None:
+    @callback
+    def _daily_unconfigured_check(_now: datetime) -> None:
         """Daily check for unconfigured lights."""
-        await _notify_unconfigured_lights(hass)
+        async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
 
     entry.async_on_unload(
         async_track_time_interval(
@@ -287,7 +316,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # If HA is already running (e.g. after an options-flow reload), run immediately.
     if hass.state is CoreState.running:
         await coordinator.async_prune_stale_storage()
-        await _notify_unconfigured_lights(hass)
+        async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
     else:
         # Track whether the listener has fired so we only cancel if it hasn't.
         # async_listen_once auto-removes after firing, so calling cancel() again
@@ -298,7 +327,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             nonlocal fired
             fired = True
             await coordinator.async_prune_stale_storage()
-            await _notify_unconfigured_lights(hass)
+            async_dispatcher_send(hass, SIGNAL_CHECK_UNCONFIGURED)
 
         cancel = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _prune_on_start)
 
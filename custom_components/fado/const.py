@@ -10,6 +10,9 @@ SERVICE_INCLUDE_LIGHTS = "include_lights"
 # Events
 EVENT_CONFIG_UPDATED = f"{DOMAIN}_config_updated"
 
+# Dispatcher signals
+SIGNAL_CHECK_UNCONFIGURED = f"{DOMAIN}_check_unconfigured"
+
 # Service attributes
 ATTR_BRIGHTNESS = "brightness"
 ATTR_BRIGHTNESS_PCT = "brightness_pct"
@@ -131,3 +134,4 @@ VALID_EASING = [
 NOTIFICATION_ID = "fado_unconfigured"
 REQUIRED_CONFIG_FIELDS = frozenset({"min_delay_ms", "min_brightness", "native_transitions"})
 UNCONFIGURED_CHECK_INTERVAL_HOURS = 24
+UNCONFIGURED_CHECK_COOLDOWN_S = 1.0  # Coalesce bursts of check requests
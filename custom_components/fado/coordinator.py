@@ -54,6 +54,7 @@ from .entity_fade_state import EntityFadeState
 from .expected_state import ExpectedState, ExpectedValues
 from .fade_change import FadeChange, FadeStep
 from .fade_params import FadeParams
+from .options import FadoOptions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,15 +88,26 @@ class FadeCoordinator:
         self._entities: dict[str, EntityFadeState] = {}
         self._autoconfiguring_lights: set[str] = set()
         self._autoconfigure_tasks: set[asyncio.Task[None]] = set()
+        # Revision counters for the cached unconfigured-lights result: bumped
+        # when a light's exclude flag or required config fields change, or
+        # when a light registry entry changes
+        self.data_revision = 0
+        self.registry_revision = 0
+        self.unconfigured_cache: tuple[tuple[int, ...], frozenset[str]] | None = None
+        # Set by async_setup_entry; None when constructed standalone (tests)
+        self.options: FadoOptions | None = None
 
     async def async_load(self) -> None:
         """Load persistent data from store."""
         self.data = await self.store.async_load() or {}
+        self.data_revision += 1
 
     async def async_prune_stale_storage(self) -> None:
         """Remove storage entries for entities that no longer exist or aren't lights.
 
         Should be called after HA has fully started (all entities registered).
+        Each key costs one indexed registry lookup; when nothing is stale the
+        store is not written and the data revision is left unchanged.
         """
         from homeassistant.helpers import entity_registry as er  # noqa: PLC0415
 
@@ -105,13 +117,16 @@ class FadeCoordinator:
             eid
             for eid in self.data
             if not eid.startswith(light_prefix)
-            or (not registry.async_get(eid) and self.hass.states.get(eid) is None)
+            or (registry.async_get(eid) is None and self.hass.states.get(eid) is None)
         ]
-        if stale:
-            for eid in stale:
-                del self.data[eid]
-            await self.store.async_save(self.data)
-            _LOGGER.info("Pruned %d stale storage entries: %s", len(stale), stale)
+        if not stale:
+            return
+
+        for eid in stale:
+            del self.data[eid]
+        self.data_revision += 1
+        await self.store.async_save(self.data)
+        _LOGGER.info("Pruned %d stale storage entries: %s", len(stale), stale)
 
     # --------------------------------------------------------------------- #
     # Service handler: fade_lights
@@ -968,6 +983,7 @@ class FadeCoordinator:
         """Set the exclude flag for one or more lights and persist."""
         for entity_id in entity_ids:
             self.get_or_create_light_config(entity_id)["exclude"] = exclude
+        self.data_revision += 1
         await self.store.async_save(self.data)
         self.hass.bus.async_fire(EVENT_CONFIG_UPDATED)
 
@@ -1026,6 +1042,7 @@ class FadeCoordinator:
         # Remove from persistent storage
         if entity_id in self.data:
             del self.data[entity_id]
+            self.data_revision += 1
             # Save updated storage
             await self.store.async_save(self.data)
             _LOGGER.info("%s: Removed persistent data for deleted entity", entity_id)
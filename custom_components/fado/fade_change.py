@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -87,6 +87,30 @@ def _clamp_mireds(mireds: int, min_mireds: int | None, max_mireds: int | None) -
 # Light Capability Helpers
 # =============================================================================
 
+# Any color mode implies brightness support except ONOFF and UNKNOWN
+_DIMMABLE_MODES = frozenset(
+    {
+        ColorMode.BRIGHTNESS,
+        ColorMode.HS,
+        ColorMode.RGB,
+        ColorMode.RGBW,
+        ColorMode.RGBWW,
+        ColorMode.XY,
+        ColorMode.COLOR_TEMP,
+    }
+)
+
+# Color modes that can render an HS color
+_HS_MODES = frozenset(
+    {
+        ColorMode.HS,
+        ColorMode.RGB,
+        ColorMode.RGBW,
+        ColorMode.RGBWW,
+        ColorMode.XY,
+    }
+)
+
 
 def _get_supported_color_modes(state_attributes: dict[str, Any]) -> set[ColorMode]:
     """Extract supported color modes from state attributes.
@@ -110,17 +134,7 @@ def _supports_brightness(supported_modes: set[ColorMode]) -> bool:
     Returns:
         True if light can be dimmed
     """
-    # Any color mode implies brightness support except ONOFF and UNKNOWN
-    dimmable_modes = {
-        ColorMode.BRIGHTNESS,
-        ColorMode.HS,
-        ColorMode.RGB,
-        ColorMode.RGBW,
-        ColorMode.RGBWW,
-        ColorMode.XY,
-        ColorMode.COLOR_TEMP,
-    }
-    return bool(supported_modes & dimmable_modes)
+    return not supported_modes.isdisjoint(_DIMMABLE_MODES)
 
 
 def _supports_hs(supported_modes: set[ColorMode]) -> bool:
@@ -132,14 +146,7 @@ def _supports_hs(supported_modes: set[ColorMode]) -> bool:
     Returns:
         True if light can use HS color
     """
-    hs_modes = {
-        ColorMode.HS,
-        ColorMode.RGB,
-        ColorMode.RGBW,
-        ColorMode.RGBWW,
-        ColorMode.XY,
-    }
-    return bool(supported_modes & hs_modes)
+    return not supported_modes.isdisjoint(_HS_MODES)
 
 
 def _supports_color_temp(supported_modes: set[ColorMode]) -> bool:
@@ -673,7 +680,7 @@ def _fill_missing_start_values(
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FadeStep:
     """A single step in a fade sequence.
 
@@ -686,7 +693,7 @@ class FadeStep:
     color_temp_kelvin: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FadeChange:  # pylint: disable=too-many-instance-attributes
     """A fade operation with flat step generation and hybrid transition support.
 
@@ -1014,6 +1021,11 @@ class FadeChange:  # pylint: disable=too-many-instance-attributes
         """Check if more steps remain."""
         return self._current_step < self.step_count()
 
+    def __iter__(self) -> Iterator[FadeStep]:
+        """Yield the remaining steps, as repeated next_step() calls would."""
+        while self.has_next():
+            yield self.next_step()
+
     def next_step(self) -> FadeStep:
         """Generate and return next step using interpolation.
 
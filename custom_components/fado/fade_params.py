@@ -27,7 +27,7 @@ from .const import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FadeParams:
     """Normalized parameters for a fade operation.
 
@@ -42,6 +42,9 @@ class FadeParams:
 
     Type/range validation and mutual exclusion are handled by the voluptuous
     schema in __init__.py. This class handles extraction and color conversion.
+
+    Instances are immutable: one FadeParams is shared by every light in a
+    service call.
     """
 
     brightness_pct: int | None = None
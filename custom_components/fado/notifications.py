@@ -9,69 +9,83 @@ from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
 from .const import (
-    DEFAULT_DASHBOARD_URL,
     DEFAULT_NOTIFICATIONS_ENABLED,
-    DEFAULT_SHOW_SIDEBAR,
     DOMAIN,
     NOTIFICATION_ID,
-    OPTION_DASHBOARD_URL,
     OPTION_NOTIFICATIONS_ENABLED,
-    OPTION_SHOW_SIDEBAR,
     REQUIRED_CONFIG_FIELDS,
 )
 from .coordinator import FadeCoordinator
+from .options import FadoOptions
 
 
 def _get_config_entry(hass: HomeAssistant) -> ConfigEntry | None:
-    """Get the Fado config entry."""
+    """Get the Fado config entry.
+
+    Uses the entry held by the coordinator's options when the integration is set
+    up, avoiding a list allocation from ``async_entries`` on every call.
+    """
+    coordinator: FadeCoordinator | None = hass.data.get(DOMAIN)
+    if coordinator is not None and coordinator.options is not None:
+        return coordinator.options.entry
+
     entries = hass.config_entries.async_entries(DOMAIN)
     return entries[0] if entries else None
 
 
-def _get_unconfigured_lights(hass: HomeAssistant) -> set[str]:
+def _get_unconfigured_lights(hass: HomeAssistant) -> frozenset[str]:
     """Return set of light entity_ids missing required configuration.
 
     A light is considered unconfigured if:
-    - It is enabled (not disabled)
+    - It is registered in the entity registry and enabled (not disabled)
     - It is NOT a light group (has entity_id in state attributes)
     - It is NOT excluded (exclude: true in storage)
     - It is missing any required config field (currently just min_delay_ms)
+
+    Candidates come from the entity registry, which HA updates before a new
+    entity writes its first state. Configured and excluded lights are removed
+    with a set difference before any state lookups are made.
+
+    The result is cached on the coordinator and reused until a light's exclude
+    flag or required config changes, a light registry entry changes, or the
+    number of light states changes (a group's state appearing changes the result).
     """
     coordinator: FadeCoordinator | None = hass.data.get(DOMAIN)
     if coordinator is None:
-        return set()
-
+        return frozenset()
+
+    cache_key = (
+        coordinator.data_revision,
+        coordinator.registry_revision,
+        hass.states.async_entity_ids_count(LIGHT_DOMAIN),
+    )
+    cached = coordinator.unconfigured_cache
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    # Enabled registered lights, minus those already excluded or fully configured
     entity_registry = er.async_get(hass)
-    storage_data = coordinator.data
-
-    unconfigured = set()
-    for entry in entity_registry.entities.values():
-        # Only check lights
-        if entry.domain != LIGHT_DOMAIN:
-            continue
-
-        # Skip disabled lights
-        if entry.disabled:
-            continue
-
-        entity_id = entry.entity_id
-
-        # Skip light groups (they have entity_id in state attributes)
-        state = hass.states.get(entity_id)
-        if state and "entity_id" in state.attributes:
-            continue
-
-        config = storage_data.get(entity_id, {})
-
-        # Skip excluded lights
-        if config.get("exclude", False):
-            continue
-
-        # Check if any required field is missing
-        if not REQUIRED_CONFIG_FIELDS.issubset(config.keys()):
-            unconfigured.add(entity_id)
-
-    return unconfigured
+    candidates = {
+        entry.entity_id
+        for entry in entity_registry.entities.values()
+        if entry.domain == LIGHT_DOMAIN and not entry.disabled
+    }
+    candidates -= {
+        entity_id
+        for entity_id, config in coordinator.data.items()
+        if config.get("exclude", False) or REQUIRED_CONFIG_FIELDS.issubset(config)
+    }
+
+    # Skip light groups (they have entity_id in state attributes)
+    unconfigured = {
+        entity_id
+        for entity_id in candidates
+        if (state := hass.states.get(entity_id)) is None or "entity_id" not in state.attributes
+    }
+
+    result = frozenset(unconfigured)
+    coordinator.unconfigured_cache = (cache_key, result)
+    return result
 
 
 def _get_notification_link_url(hass: HomeAssistant) -> str:
@@ -79,16 +93,28 @@ def _get_notification_link_url(hass: HomeAssistant) -> str:
 
     Returns the URL string, or empty string for no link.
     If sidebar is enabled, links to /fado. Otherwise uses the dashboard URL option.
+    Uses the coordinator's cached options when the integration is set up.
     """
+    coordinator: FadeCoordinator | None = hass.data.get(DOMAIN)
+    if coordinator is not None and coordinator.options is not None:
+        return coordinator.options.link_url
+
     entry = _get_config_entry(hass)
     if not entry:
         return "/fado"
 
-    show_sidebar = entry.options.get(OPTION_SHOW_SIDEBAR, DEFAULT_SHOW_SIDEBAR)
-    if show_sidebar:
-        return "/fado"
+    return FadoOptions(entry).link_url
 
-    return entry.options.get(OPTION_DASHBOARD_URL, DEFAULT_DASHBOARD_URL)
+
+def _notifications_enabled(hass: HomeAssistant) -> bool:
+    """Return whether unconfigured-light notifications are enabled.
+
+    Defaults to enabled when there is no config entry.
+    """
+    entry = _get_config_entry(hass)
+    if not entry:
+        return True
+    return entry.options.get(OPTION_NOTIFICATIONS_ENABLED, DEFAULT_NOTIFICATIONS_ENABLED)
 
 
 async def _notify_unconfigured_lights(hass: HomeAssistant) -> None:
@@ -104,15 +130,10 @@ async def _notify_unconfigured_lights(hass: HomeAssistant) -> None:
     if hass.state is not CoreState.running:
         return
 
-    # Check if notifications are enabled
-    entry = _get_config_entry(hass)
-    if entry:
-        notifications_enabled = entry.options.get(
-            OPTION_NOTIFICATIONS_ENABLED, DEFAULT_NOTIFICATIONS_ENABLED
-        )
-        if not notifications_enabled:
-            persistent_notification.async_dismiss(hass, NOTIFICATION_ID)
-            return
+    # Bail out before scanning lights if the result would be discarded
+    if not _notifications_enabled(hass):
+        persistent_notification.async_dismiss(hass, NOTIFICATION_ID)
+        return
 
     unconfigured = _get_unconfigured_lights(hass)
 
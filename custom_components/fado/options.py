@@ -0,0 +1,41 @@
+"""Cached view of the Fado config entry options."""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    DEFAULT_DASHBOARD_URL,
+    DEFAULT_SHOW_SIDEBAR,
+    OPTION_DASHBOARD_URL,
+    OPTION_SHOW_SIDEBAR,
+)
+
+
+class FadoOptions:
+    """Derived values computed from the config entry options.
+
+    Stored on the coordinator for the lifetime of the config entry. The options
+    flow reloads the entry, which creates a fresh instance; other in-place
+    option updates must call ``invalidate()``.
+    """
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        self.entry = entry
+
+    @cached_property
+    def link_url(self) -> str:
+        """URL for the notification link, or empty string for no link.
+
+        If sidebar is enabled, links to /fado. Otherwise uses the dashboard URL option.
+        """
+        options = self.entry.options
+        if options.get(OPTION_SHOW_SIDEBAR, DEFAULT_SHOW_SIDEBAR):
+            return "/fado"
+        return options.get(OPTION_DASHBOARD_URL, DEFAULT_DASHBOARD_URL)
+
+    def invalidate(self) -> None:
+        """Drop cached values so they are recomputed from the current options."""
+        self.__dict__.pop("link_url", None)
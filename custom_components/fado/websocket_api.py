@@ -208,6 +208,9 @@ async def async_save_light_config(
     elif clear_min_brightness:
         data[entity_id].pop("min_brightness", None)
 
+    # Every field above feeds the unconfigured-lights check
+    coordinator.data_revision += 1
+
     # Save to disk
     await coordinator.save_storage()
 
@@ -548,14 +551,14 @@ async def ws_save_settings(
         connection.send_error(msg["id"], "not_found", "Config entry not found")
         return
 
+    coordinator: FadeCoordinator | None = hass.data.get(DOMAIN)
     new_options = dict(entry.options)
 
     if "default_min_delay_ms" in msg:
         new_options[OPTION_MIN_STEP_DELAY_MS] = msg["default_min_delay_ms"]
         # Update runtime data
-        coordinator_obj: FadeCoordinator | None = hass.data.get(DOMAIN)
-        if coordinator_obj is not None:
-            coordinator_obj.min_step_delay_ms = msg["default_min_delay_ms"]
+        if coordinator is not None:
+            coordinator.min_step_delay_ms = msg["default_min_delay_ms"]
 
     if "log_level" in msg:
         new_options[OPTION_LOG_LEVEL] = msg["log_level"]
@@ -563,6 +566,8 @@ async def ws_save_settings(
         await _apply_log_level(hass, msg["log_level"])
 
     hass.config_entries.async_update_entry(entry, options=new_options)
+    if coordinator is not None and coordinator.options is not None:
+        coordinator.options.invalidate()
 
     connection.send_result(msg["id"], {"success": True})
 
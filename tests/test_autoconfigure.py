@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -25,11 +26,9 @@ from custom_components.fado.coordinator import FadeCoordinator
 @pytest.fixture
 def hass_with_storage(hass: HomeAssistant) -> HomeAssistant:
     """Set up hass with storage data."""
-    mock_store = MagicMock()
-    mock_store.async_save = AsyncMock()
     coordinator = FadeCoordinator(
         hass=hass,
-        store=mock_store,
+        store=SimpleNamespace(async_save=AsyncMock()),  # type: ignore[arg-type]
         min_step_delay_ms=100,
     )
     hass.data[DOMAIN] = coordinator
@@ -66,9 +66,8 @@ class TestExecuteFadeWithColors:
 
         params = FadeParams(
             hs_color=(120.0, 80.0),  # Target green
+            transition_ms=1000,
         )
-
-        params.transition_ms = 1000
         await coordinator._execute_fade(
             "light.test",
             params,
@@ -98,9 +97,8 @@ class TestExecuteFadeWithColors:
 
         params = FadeParams(
             color_temp_kelvin=2500,  # Target warm white (400 mireds equivalent)
+            transition_ms=1000,
         )
-
-        params.transition_ms = 1000
         await coordinator._execute_fade(
             "light.test",
             params,
@@ -131,9 +129,8 @@ class TestExecuteFadeWithColors:
         params = FadeParams(
             brightness_pct=100,  # Target full brightness
             hs_color=(240.0, 100.0),  # Target blue
+            transition_ms=1000,
         )
-
-        params.transition_ms = 1000
         await coordinator._execute_fade(
             "light.test",
             params,
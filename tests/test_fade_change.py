@@ -241,6 +241,22 @@ class TestFadeChangeIterator:
             steps.append(change.next_step())
         assert len(steps) == change.step_count()
 
+    def test_iter_yields_remaining_steps(self) -> None:
+        """Test iterating a FadeChange yields the steps next_step() has not yet returned."""
+        change = FadeChange(
+            start_brightness=100,
+            end_brightness=200,
+            transition_ms=500,  # 5 steps
+            min_step_delay_ms=100,
+        )
+        first = change.next_step()
+        rest = list(change)
+
+        assert len(rest) == change.step_count() - 1
+        assert first not in rest
+        assert rest[-1].brightness == 200
+        assert change.has_next() is False
+
 
 class TestFadeChangeInterpolateBrightness:
     """Test brightness interpolation."""
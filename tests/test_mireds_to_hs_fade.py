@@ -15,6 +15,9 @@ from custom_components.fado.fade_params import FadeParams
 # Alias for cleaner test code
 _resolve_fade = FadeChange.resolve
 
+# Shared cancel event for fades that are never cancelled (never .set() it)
+_NEVER_CANCEL = asyncio.Event()
+
 
 @pytest.fixture
 def mock_hass():
@@ -62,7 +65,7 @@ class TestColorTempToHsFade:
         """
         mock_hass.states.get = MagicMock(return_value=color_temp_light_state)
 
-        cancel_event = asyncio.Event()
+        cancel_event = _NEVER_CANCEL
 
         fade_params = FadeParams(
             brightness_pct=None,
@@ -109,7 +112,7 @@ class TestColorTempToHsFade:
         }
         mock_hass.states.get = MagicMock(return_value=hs_state)
 
-        cancel_event = asyncio.Event()
+        cancel_event = _NEVER_CANCEL
 
         fade_params = FadeParams(
             brightness_pct=None,
@@ -144,7 +147,7 @@ class TestColorTempToHsFade:
         """Test that COLOR_TEMP to color temp uses standard fade (no mode switch needed)."""
         mock_hass.states.get = MagicMock(return_value=color_temp_light_state)
 
-        cancel_event = asyncio.Event()
+        cancel_event = _NEVER_CANCEL
 
         fade_params = FadeParams(
             brightness_pct=None,
@@ -226,7 +229,7 @@ class TestHsToColorTempFade:
         }
         mock_hass.states.get = MagicMock(return_value=hs_state)
 
-        cancel_event = asyncio.Event()
+        cancel_event = _NEVER_CANCEL
 
         fade_params = FadeParams(
             brightness_pct=None,
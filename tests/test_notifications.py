@@ -1,13 +1,15 @@
 """Tests for unconfigured lights notification."""
 
+import asyncio
+from dataclasses import dataclass
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.components.light.const import DOMAIN as LIGHT_DOMAIN
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CoreState, HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.fado import async_setup_entry
 from custom_components.fado.const import (
@@ -16,6 +18,7 @@ from custom_components.fado.const import (
     OPTION_DASHBOARD_URL,
     OPTION_NOTIFICATIONS_ENABLED,
     OPTION_SHOW_SIDEBAR,
+    UNCONFIGURED_CHECK_COOLDOWN_S,
 )
 from custom_components.fado.coordinator import FadeCoordinator
 from custom_components.fado.notifications import (
@@ -23,15 +26,15 @@ from custom_components.fado.notifications import (
     _get_unconfigured_lights,
     _notify_unconfigured_lights,
 )
+from custom_components.fado.options import FadoOptions
+from custom_components.fado.websocket_api import async_save_light_config
 
 
 def _make_coordinator(hass: HomeAssistant, data: dict | None = None) -> FadeCoordinator:
     """Create a FadeCoordinator with mock store and given data."""
-    mock_store = MagicMock()
-    mock_store.async_save = AsyncMock()
     coordinator = FadeCoordinator(
         hass=hass,
-        store=mock_store,
+        store=SimpleNamespace(async_save=AsyncMock()),  # type: ignore[arg-type]
         min_step_delay_ms=100,
     )
     if data is not None:
@@ -40,159 +43,339 @@ def _make_coordinator(hass: HomeAssistant, data: dict | None = None) -> FadeCoor
     return coordinator
 
 
+@dataclass(slots=True)
+class _FakeEntry:
+    """Stand-in for an entity registry entry with only the fields notifications read."""
+
+    entity_id: str
+    disabled: bool = False
+
+    @property
+    def domain(self) -> str:
+        """Domain part of the entity_id, as on a real registry entry."""
+        return self.entity_id.partition(".")[0]
+
+
+def _register_lights(
+    hass: HomeAssistant, registry: SimpleNamespace, entries: list[_FakeEntry]
+) -> None:
+    """Add entries to the fake registry and give each one a state."""
+    registry.entities.update({entry.entity_id: entry for entry in entries})
+    for entry in entries:
+        hass.states.async_set(entry.entity_id, "on")
+
+
+async def _async_expire_check_cooldown(hass: HomeAssistant) -> None:
+    """Advance time past the unconfigured-check cooldown and run any deferred check."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=UNCONFIGURED_CHECK_COOLDOWN_S)
+    )
+    await hass.async_block_till_done()
+
+
 @pytest.fixture
-def mock_entity_registry():
-    """Create a mock entity registry."""
-    registry = MagicMock()
+def fake_registry(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the entity registry with a plain namespace that has no entries."""
+    entities: dict[str, _FakeEntry] = {}
+    registry = SimpleNamespace(entities=entities, async_get=entities.get)
+    monkeypatch.setattr("homeassistant.helpers.entity_registry.async_get", lambda hass: registry)
     return registry
 
 
+def _record_entry_lookups(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record config entry lookups made through hass.config_entries.async_entries."""
+    lookups: list[str] = []
+    real_async_entries = hass.config_entries.async_entries
+
+    def _async_entries(domain: str | None = None, *args, **kwargs):
+        lookups.append(domain)
+        return real_async_entries(domain, *args, **kwargs)
+
+    monkeypatch.setattr(hass.config_entries, "async_entries", _async_entries)
+    return lookups
+
+
+@pytest.fixture
+def notifications(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Record persistent notification messages created and IDs dismissed."""
+    calls = SimpleNamespace(created=[], dismissed=[])
+
+    def _create(hass: HomeAssistant, message: str, **kwargs) -> None:
+        calls.created.append(message)
+
+    def _dismiss(hass: HomeAssistant, notification_id: str) -> None:
+        calls.dismissed.append(notification_id)
+
+    monkeypatch.setattr("homeassistant.components.persistent_notification.async_create", _create)
+    monkeypatch.setattr("homeassistant.components.persistent_notification.async_dismiss", _dismiss)
+    return calls
+
+
+@pytest.fixture
+def setup_stubs(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip websocket, log level and frontend registration in async_setup_entry."""
+
+    async def _apply_stored_log_level(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+        return None
+
+    monkeypatch.setattr("custom_components.fado.async_register_websocket_api", lambda hass: None)
+    monkeypatch.setattr("custom_components.fado._apply_stored_log_level", _apply_stored_log_level)
+    monkeypatch.setattr(hass, "http", None, raising=False)
+
+
+@pytest.fixture
+def check_calls(setup_stubs: None, monkeypatch: pytest.MonkeyPatch) -> list[HomeAssistant]:
+    """Record unconfigured-light checks run by async_setup_entry's triggers."""
+    calls: list[HomeAssistant] = []
+
+    async def _notify_unconfigured_lights(hass: HomeAssistant) -> None:
+        calls.append(hass)
+
+    monkeypatch.setattr(
+        "custom_components.fado._notify_unconfigured_lights", _notify_unconfigured_lights
+    )
+    return calls
+
+
+@pytest.fixture
+def fado_entry(hass: HomeAssistant, mock_config_entry: MockConfigEntry) -> MockConfigEntry:
+    """Add the Fado config entry to hass without setting it up."""
+    mock_config_entry.add_to_hass(hass)
+    return mock_config_entry
+
+
 class TestGetUnconfiguredLights:
     """Test _get_unconfigured_lights function."""
 
-    def test_returns_empty_when_domain_not_loaded(self, hass: HomeAssistant) -> None:
+    def test_returns_empty_when_domain_not_loaded(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
         """Test returns empty set when domain not in hass.data."""
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities = {}
-            result = _get_unconfigured_lights(hass)
+        result = _get_unconfigured_lights(hass)
         assert result == set()
 
-    def test_returns_unconfigured_light(self, hass: HomeAssistant) -> None:
-        """Test returns light missing min_delay_ms."""
+    @pytest.mark.parametrize(
+        ("data", "entity_id", "disabled", "expected"),
+        [
+            pytest.param(None, "light.bedroom", False, {"light.bedroom"}, id="unconfigured"),
+            pytest.param(
+                {
+                    "light.bedroom": {
+                        "min_delay_ms": 100,
+                        "min_brightness": 1,
+                        "native_transitions": True,
+                    }
+                },
+                "light.bedroom",
+                False,
+                set(),
+                id="configured",
+            ),
+            pytest.param(None, "light.bedroom", True, set(), id="disabled"),
+            pytest.param(
+                {"light.bedroom": {"exclude": True}}, "light.bedroom", False, set(), id="excluded"
+            ),
+            pytest.param(None, "switch.bedroom", False, set(), id="non_light"),
+        ],
+    )
+    def test_filters_lights(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        data: dict | None,
+        entity_id: str,
+        disabled: bool,
+        expected: set[str],
+    ) -> None:
+        """Test only enabled, non-excluded lights missing required fields are returned."""
+        _make_coordinator(hass, data)
+        _register_lights(hass, fake_registry, [_FakeEntry(entity_id, disabled=disabled)])
+
+        assert _get_unconfigured_lights(hass) == expected
+
+    def test_excludes_unregistered_light(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test excludes light states with no entity registry entry."""
         _make_coordinator(hass)
+        hass.states.async_set("light.bedroom", "on")
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
+        result = _get_unconfigured_lights(hass)
 
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            result = _get_unconfigured_lights(hass)
+        assert result == set()
 
-        assert result == {"light.bedroom"}
+    def test_includes_registered_light_without_state(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test a newly registered light counts before it has written a state."""
+        _make_coordinator(hass)
+        fake_registry.entities["light.bedroom"] = _FakeEntry("light.bedroom")
 
-    def test_excludes_configured_light(self, hass: HomeAssistant) -> None:
-        """Test excludes light with all required fields configured."""
-        _make_coordinator(
-            hass,
-            {
-                "light.bedroom": {
-                    "min_delay_ms": 100,
-                    "min_brightness": 1,
-                    "native_transitions": True,
-                }
-            },
-        )
+        assert _get_unconfigured_lights(hass) == {"light.bedroom"}
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
+    def test_excludes_light_group(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test excludes lights whose state lists member entity_ids."""
+        _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.group")])
+        hass.states.async_set("light.group", "on", {"entity_id": ["light.a", "light.b"]})
 
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            result = _get_unconfigured_lights(hass)
+        assert _get_unconfigured_lights(hass) == set()
 
-        assert result == set()
 
-    def test_excludes_disabled_light(self, hass: HomeAssistant) -> None:
-        """Test excludes disabled lights."""
+class TestUnconfiguredLightsCache:
+    """Test caching of the _get_unconfigured_lights result."""
+
+    def test_reuses_result_when_nothing_changed(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test a repeat call returns the cached result without re-scanning."""
         _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+        first = _get_unconfigured_lights(hass)
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = True
+        fake_registry.entities = MagicMock()
+        second = _get_unconfigured_lights(hass)
 
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            result = _get_unconfigured_lights(hass)
+        assert second is first
+        fake_registry.entities.values.assert_not_called()
 
-        assert result == set()
+    @pytest.mark.usefixtures("notifications")
+    async def test_invalidated_by_light_config_save(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test saving a light's config invalidates the cached result."""
+        _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+        assert _get_unconfigured_lights(hass) == {"light.bedroom"}
 
-    def test_excludes_excluded_light(self, hass: HomeAssistant) -> None:
-        """Test excludes lights marked as excluded."""
-        _make_coordinator(hass, {"light.bedroom": {"exclude": True}})
+        await async_save_light_config(
+            hass, "light.bedroom", min_delay_ms=100, native_transitions=True, min_brightness=1
+        )
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
+        assert _get_unconfigured_lights(hass) == set()
 
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            result = _get_unconfigured_lights(hass)
+    async def test_invalidated_by_set_exclude(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test excluding a light invalidates the cached result."""
+        coordinator = _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+        assert _get_unconfigured_lights(hass) == {"light.bedroom"}
 
-        assert result == set()
+        await coordinator.set_exclude(["light.bedroom"], True)
 
-    def test_excludes_non_light_entities(self, hass: HomeAssistant) -> None:
-        """Test excludes non-light domain entities."""
-        _make_coordinator(hass)
+        assert _get_unconfigured_lights(hass) == set()
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "switch.bedroom"
-        mock_entry.domain = "switch"
-        mock_entry.disabled = False
+    async def test_kept_across_fade_storage_save(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test saving orig_brightness after a fade does not invalidate the cached result."""
+        coordinator = _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+        first = _get_unconfigured_lights(hass)
 
-        with patch("custom_components.fado.notifications.er.async_get") as mock_er:
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            result = _get_unconfigured_lights(hass)
+        coordinator.store_orig_brightness("light.bedroom", 200)
+        await coordinator.save_storage()
+        fake_registry.entities = MagicMock()
 
-        assert result == set()
+        assert _get_unconfigured_lights(hass) is first
+        fake_registry.entities.values.assert_not_called()
+
+    def test_invalidated_by_registry_revision(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test a registry revision bump invalidates the cached result."""
+        coordinator = _make_coordinator(hass)
+        light = _FakeEntry("light.bedroom")
+        _register_lights(hass, fake_registry, [light])
+        assert _get_unconfigured_lights(hass) == {"light.bedroom"}
+
+        light.disabled = True
+        coordinator.registry_revision += 1
+
+        assert _get_unconfigured_lights(hass) == set()
+
+    @pytest.mark.usefixtures("setup_stubs", "notifications")
+    async def test_invalidated_by_registry_update_event(
+        self, hass: HomeAssistant, fado_entry: MockConfigEntry
+    ) -> None:
+        """Test the registry listener invalidates the cache when a light is disabled."""
+        from homeassistant.helpers import entity_registry as er
+
+        registry = er.async_get(hass)
+        light = registry.async_get_or_create("light", "demo", "uid1")
+        hass.states.async_set(light.entity_id, "on")
+        await async_setup_entry(hass, fado_entry)
+        await _async_expire_check_cooldown(hass)
+        coordinator: FadeCoordinator = hass.data[DOMAIN]
+        first = _get_unconfigured_lights(hass)
+        assert first == {light.entity_id}
+
+        # Fires EVENT_ENTITY_REGISTRY_UPDATED with a disabled_by change
+        registry.async_update_entity(light.entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+        await hass.async_block_till_done()
+
+        assert coordinator.unconfigured_cache is not None
+        assert coordinator.unconfigured_cache[1] is not first
+        assert _get_unconfigured_lights(hass) == set()
+
+    def test_invalidated_by_new_light_state(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
+        """Test a light state appearing invalidates the cached result."""
+        _make_coordinator(hass)
+        bedroom = _FakeEntry("light.bedroom")
+        _register_lights(hass, fake_registry, [bedroom])
+        assert _get_unconfigured_lights(hass) == {"light.bedroom"}
+
+        _register_lights(hass, fake_registry, [bedroom, _FakeEntry("light.kitchen")])
+
+        assert _get_unconfigured_lights(hass) == {"light.bedroom", "light.kitchen"}
 
 
 class TestNotifyUnconfiguredLights:
     """Test _notify_unconfigured_lights function."""
 
-    async def test_creates_notification_when_unconfigured(self, hass: HomeAssistant) -> None:
+    async def test_creates_notification_when_unconfigured(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test creates notification when lights are unconfigured."""
         _make_coordinator(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
-
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
-
-        mock_create.assert_called_once()
-        call_args = mock_create.call_args
-        assert "1 light" in call_args[0][1]
-        assert "/fado" in call_args[0][1]
-
-    async def test_creates_notification_plural(self, hass: HomeAssistant) -> None:
+        await _notify_unconfigured_lights(hass)
+
+        assert len(notifications.created) == 1
+        assert "1 light" in notifications.created[0]
+        assert "/fado" in notifications.created[0]
+
+    async def test_creates_notification_plural(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test notification message is plural for multiple lights."""
         _make_coordinator(hass)
 
-        mock_entries = []
-        for name in ["bedroom", "kitchen"]:
-            entry = MagicMock()
-            entry.entity_id = f"light.{name}"
-            entry.domain = LIGHT_DOMAIN
-            entry.disabled = False
-            mock_entries.append(entry)
-
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-        ):
-            mock_er.return_value.entities.values.return_value = mock_entries
-            await _notify_unconfigured_lights(hass)
-
-        call_args = mock_create.call_args
-        assert "2 lights" in call_args[0][1]
-
-    async def test_dismisses_notification_when_all_configured(self, hass: HomeAssistant) -> None:
+        lights = [_FakeEntry(f"light.{name}") for name in ["bedroom", "kitchen"]]
+        _register_lights(hass, fake_registry, lights)
+
+        await _notify_unconfigured_lights(hass)
+
+        assert "2 lights" in notifications.created[-1]
+
+    async def test_dismisses_notification_when_all_configured(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test dismisses notification when no unconfigured lights."""
         _make_coordinator(
             hass,
@@ -205,342 +388,314 @@ class TestNotifyUnconfiguredLights:
             },
         )
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
 
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_dismiss"
-            ) as mock_dismiss,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
+        await _notify_unconfigured_lights(hass)
 
-        mock_dismiss.assert_called_once_with(hass, NOTIFICATION_ID)
+        assert notifications.dismissed == [NOTIFICATION_ID]
 
-    async def test_dismisses_notification_when_no_lights(self, hass: HomeAssistant) -> None:
+    async def test_dismisses_notification_when_no_lights(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test dismisses notification when no lights exist."""
         _make_coordinator(hass)
 
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_dismiss"
-            ) as mock_dismiss,
-        ):
-            mock_er.return_value.entities.values.return_value = []
-            await _notify_unconfigured_lights(hass)
+        await _notify_unconfigured_lights(hass)
 
-        mock_dismiss.assert_called_once_with(hass, NOTIFICATION_ID)
+        assert notifications.dismissed == [NOTIFICATION_ID]
 
 
 class TestNotifySkippedBeforeStart:
     """Test that notifications are skipped before HA has fully started."""
 
-    async def test_skips_when_ha_not_running(self, hass: HomeAssistant) -> None:
+    async def test_skips_when_ha_not_running(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test notification is skipped when hass.state is not running."""
         _make_coordinator(hass)
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
 
         hass.state = CoreState.starting
 
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_dismiss"
-            ) as mock_dismiss,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
+        await _notify_unconfigured_lights(hass)
 
         # Neither create nor dismiss should be called before HA is running
-        mock_create.assert_not_called()
-        mock_dismiss.assert_not_called()
+        assert notifications.created == []
+        assert notifications.dismissed == []
 
+    @pytest.mark.usefixtures("setup_stubs")
     async def test_entity_registry_create_during_startup_no_notification(
-        self, hass: HomeAssistant
+        self,
+        hass: HomeAssistant,
+        fado_entry: MockConfigEntry,
+        notifications: SimpleNamespace,
     ) -> None:
         """Test that entity registry create events during startup don't trigger notifications."""
         from homeassistant.helpers import entity_registry as er
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
-
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
+        await async_setup_entry(hass, fado_entry)
+        # Let the setup check's cooldown lapse so the event below reaches notify
+        await _async_expire_check_cooldown(hass)
 
         # HA is still starting at this point
         hass.state = CoreState.starting
 
-        with patch(
-            "custom_components.fado.notifications.persistent_notification.async_create"
-        ) as mock_create:
-            # Simulate entity registry create event (happens during startup)
-            hass.bus.async_fire(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {"action": "create", "entity_id": "light.new_group"},
-            )
-            await hass.async_block_till_done()
+        # Registering a light fires the create event (happens during startup)
+        er.async_get(hass).async_get_or_create(
+            "light", "group", "new_group", suggested_object_id="new_group"
+        )
+        await _async_expire_check_cooldown(hass)
 
         # Should not create notification while HA is still starting
-        mock_create.assert_not_called()
+        assert notifications.created == []
 
 
 class TestSetupNotification:
     """Test notification on setup."""
 
-    async def test_checks_unconfigured_after_start(self, hass: HomeAssistant) -> None:
+    async def test_checks_unconfigured_after_start(
+        self, hass: HomeAssistant, fado_entry: MockConfigEntry, check_calls: list[HomeAssistant]
+    ) -> None:
         """Test that unconfigured check waits for homeassistant_started during initial boot."""
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
-
         # Simulate HA still starting (initial boot, not a reload)
         hass.state = CoreState.starting
 
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]  # Skip panel registration
-            await async_setup_entry(hass, mock_entry)
+        await async_setup_entry(hass, fado_entry)
 
-            # Not called during setup (states may not be loaded yet)
-            mock_notify.assert_not_called()
+        # Not called during setup (states may not be loaded yet)
+        assert check_calls == []
 
-            # Fire the started event (all entity states now available)
-            hass.bus.async_fire("homeassistant_started")
-            await hass.async_block_till_done()
+        # Fire the started event (all entity states now available)
+        hass.bus.async_fire("homeassistant_started")
+        await hass.async_block_till_done()
 
-        mock_notify.assert_called_once_with(hass)
+        assert check_calls == [hass]
 
-    async def test_checks_unconfigured_immediately_when_running(self, hass: HomeAssistant) -> None:
+    async def test_checks_unconfigured_immediately_when_running(
+        self, hass: HomeAssistant, fado_entry: MockConfigEntry, check_calls: list[HomeAssistant]
+    ) -> None:
         """Test that unconfigured check runs immediately during a reload."""
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
-
         # hass.is_running is True by default (simulating a reload)
 
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None
-            await async_setup_entry(hass, mock_entry)
+        await async_setup_entry(hass, fado_entry)
 
         # Called immediately during setup since HA is already running
-        mock_notify.assert_called_once_with(hass)
+        assert check_calls == [hass]
 
 
 class TestEntityRegistryNotification:
     """Test notification on entity registry events."""
 
-    async def test_notifies_on_light_create(self, hass: HomeAssistant) -> None:
+    @pytest.fixture(autouse=True)
+    async def _set_up(
+        self, hass: HomeAssistant, fado_entry: MockConfigEntry, check_calls: list[HomeAssistant]
+    ) -> None:
+        """Set up the entry and let the setup check's cooldown lapse, then clear that call."""
+        await async_setup_entry(hass, fado_entry)
+        await _async_expire_check_cooldown(hass)
+        check_calls.clear()
+
+    async def test_notifies_on_light_create(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
         """Test notification check on light entity creation."""
         from homeassistant.helpers import entity_registry as er
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
-
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
-
-            # Reset mock to clear the call from setup
-            mock_notify.reset_mock()
-
-            # Simulate entity registry create event
-            hass.bus.async_fire(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {"action": "create", "entity_id": "light.new_light"},
-            )
-            await hass.async_block_till_done()
+        # Simulate entity registry create event
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "create", "entity_id": "light.new_light"},
+        )
+        # Yield once so the registry listener task runs
+        await asyncio.sleep(0)
 
-            mock_notify.assert_called()
+        assert check_calls
 
-    async def test_notifies_on_light_reenable(self, hass: HomeAssistant) -> None:
+    async def test_notifies_on_light_reenable(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
         """Test notification check when light is re-enabled."""
         from homeassistant.helpers import entity_registry as er
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
-
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
-
-            # Reset mock to clear the call from setup
-            mock_notify.reset_mock()
-
-            # Simulate entity registry update with disabled_by change
-            hass.bus.async_fire(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {
-                    "action": "update",
-                    "entity_id": "light.bedroom",
-                    "changes": {"disabled_by": None},
-                },
-            )
-            await hass.async_block_till_done()
+        # Simulate entity registry update with disabled_by change
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {
+                "action": "update",
+                "entity_id": "light.bedroom",
+                "changes": {"disabled_by": None},
+            },
+        )
+        # Yield once so the registry listener task runs
+        await asyncio.sleep(0)
 
-            mock_notify.assert_called()
+        assert check_calls
 
-    async def test_notifies_on_light_remove(self, hass: HomeAssistant) -> None:
+    async def test_notifies_on_light_remove(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
         """Test notification check on light removal (may dismiss)."""
         from homeassistant.helpers import entity_registry as er
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
+        # Simulate entity registry remove event
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "remove", "entity_id": "light.old_light"},
+        )
+        # Yield once so the registry listener task runs
+        await asyncio.sleep(0)
 
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
+        assert check_calls
 
-            # Reset mock to clear the call from setup
-            mock_notify.reset_mock()
+    async def test_ignores_non_light_entities(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
+        """Test ignores non-light entity events."""
+        from homeassistant.helpers import entity_registry as er
 
-            # Simulate entity registry remove event
-            hass.bus.async_fire(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {"action": "remove", "entity_id": "light.old_light"},
-            )
-            await hass.async_block_till_done()
+        # Simulate switch entity creation
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {"action": "create", "entity_id": "switch.new_switch"},
+        )
+        # Yield once so the registry listener task runs
+        await asyncio.sleep(0)
 
-            mock_notify.assert_called()
+        assert check_calls == []
 
-    async def test_ignores_non_light_entities(self, hass: HomeAssistant) -> None:
-        """Test ignores non-light entity events."""
+    async def test_ignores_update_without_disabled_change(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
+        """Test ignores updates that don't change disabled state."""
         from homeassistant.helpers import entity_registry as er
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
+        # Simulate entity registry update without disabled_by change
+        hass.bus.async_fire(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            {
+                "action": "update",
+                "entity_id": "light.bedroom",
+                "changes": {"name": "New Name"},
+            },
+        )
+        # Yield once so the registry listener task runs
+        await asyncio.sleep(0)
 
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
+        assert check_calls == []
 
-            # Reset mock to clear the call from setup
-            mock_notify.reset_mock()
+    async def test_coalesces_burst_of_registry_events(
+        self, hass: HomeAssistant, check_calls: list[HomeAssistant]
+    ) -> None:
+        """Test a burst of registry events runs one immediate and one deferred check."""
+        from homeassistant.helpers import entity_registry as er
 
-            # Simulate switch entity creation
+        # Simulate a burst of light creations (e.g. an integration reload)
+        for name in ("one", "two", "three"):
             hass.bus.async_fire(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {"action": "create", "entity_id": "switch.new_switch"},
+                {"action": "create", "entity_id": f"light.{name}"},
             )
-            await hass.async_block_till_done()
+        await hass.async_block_till_done()
 
-            mock_notify.assert_not_called()
+        # First event runs immediately, the rest wait for the cooldown
+        assert len(check_calls) == 1
 
-    async def test_ignores_update_without_disabled_change(self, hass: HomeAssistant) -> None:
-        """Test ignores updates that don't change disabled state."""
-        from homeassistant.helpers import entity_registry as er
+        await _async_expire_check_cooldown(hass)
 
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        mock_entry.async_on_unload = MagicMock()
+        assert len(check_calls) == 2
 
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights") as mock_notify,
-            patch("custom_components.fado._apply_stored_log_level"),
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
 
-            # Reset mock to clear the call from setup
-            mock_notify.reset_mock()
+class TestRuntimeLightDetection:
+    """Test lights added while HA is running are detected with the real entity registry."""
 
-            # Simulate entity registry update without disabled_by change
-            hass.bus.async_fire(
-                er.EVENT_ENTITY_REGISTRY_UPDATED,
-                {
-                    "action": "update",
-                    "entity_id": "light.bedroom",
-                    "changes": {"name": "New Name"},
-                },
-            )
-            await hass.async_block_till_done()
+    @pytest.mark.usefixtures("setup_stubs")
+    async def test_registry_create_then_state_write_after_cooldown(
+        self,
+        hass: HomeAssistant,
+        fado_entry: MockConfigEntry,
+        notifications: SimpleNamespace,
+    ) -> None:
+        """Test a light registered before its first state write still raises a notification."""
+        from homeassistant.helpers import entity_registry as er
+
+        await async_setup_entry(hass, fado_entry)
+        await _async_expire_check_cooldown(hass)
+        notifications.created.clear()
 
-            mock_notify.assert_not_called()
+        # HA writes the registry entry (firing the create event) before the state
+        entry = er.async_get(hass).async_get_or_create("light", "demo", "uid1")
+        hass.states.async_set(entry.entity_id, "on")
+        await hass.async_block_till_done()
+
+        assert len(notifications.created) == 1
+        assert "1 light detected without configuration" in notifications.created[0]
 
 
 class TestDailyNotificationTimer:
     """Test daily notification timer."""
 
-    async def test_registers_daily_timer(self, hass: HomeAssistant) -> None:
+    @pytest.fixture
+    def timers(self, monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+        """Record async_track_time_interval registrations instead of scheduling them."""
+        registered: list[tuple] = []
+
+        def _track(hass: HomeAssistant, action, interval: timedelta):
+            registered.append((hass, action, interval))
+            return lambda: None
+
+        monkeypatch.setattr("custom_components.fado.async_track_time_interval", _track)
+        return registered
+
+    async def test_registers_daily_timer(
+        self,
+        hass: HomeAssistant,
+        fado_entry: MockConfigEntry,
+        check_calls: list[HomeAssistant],
+        timers: list[tuple],
+    ) -> None:
         """Test that setup registers a daily timer."""
-        mock_entry = MagicMock(spec=ConfigEntry)
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {}
-        unload_callbacks = []
-        mock_entry.async_on_unload = lambda cb: unload_callbacks.append(cb)
-
-        with (
-            patch("custom_components.fado.async_register_websocket_api"),
-            patch("custom_components.fado._notify_unconfigured_lights"),
-            patch("custom_components.fado._apply_stored_log_level"),
-            patch("custom_components.fado.async_track_time_interval") as mock_timer,
-        ):
-            hass.http = None  # type: ignore[assignment]
-            await async_setup_entry(hass, mock_entry)
+        await async_setup_entry(hass, fado_entry)
 
         # Verify timer was registered with 24 hour interval
-        mock_timer.assert_called_once()
-        call_args = mock_timer.call_args
-        assert call_args[0][0] is hass  # First arg is hass
-        assert call_args[0][2] == timedelta(hours=24)  # Third arg is interval
+        assert len(timers) == 1
+        timer_hass, _action, interval = timers[0]
+        assert timer_hass is hass
+        assert interval == timedelta(hours=24)
+
+    async def test_daily_timer_requests_debounced_check(
+        self,
+        hass: HomeAssistant,
+        fado_entry: MockConfigEntry,
+        check_calls: list[HomeAssistant],
+        timers: list[tuple],
+    ) -> None:
+        """Test the daily timer goes through the same debounced check as other triggers."""
+        await async_setup_entry(hass, fado_entry)
+        daily_check = timers[0][1]
+
+        # Within the cooldown of the setup check, the daily tick is deferred
+        check_calls.clear()
+        daily_check(dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert check_calls == []
+
+        await _async_expire_check_cooldown(hass)
+        assert check_calls == [hass]
 
 
 class TestPruneStaleStorage:
     """Test async_prune_stale_storage removes non-light entities."""
 
-    async def test_prunes_non_light_entities(self, hass: HomeAssistant) -> None:
+    async def test_prunes_non_light_entities(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
         """Test that non-light entities are removed from storage."""
         coordinator = _make_coordinator(
             hass,
@@ -551,22 +706,19 @@ class TestPruneStaleStorage:
             },
         )
 
-        mock_registry = MagicMock()
-        mock_entry = MagicMock(entity_id="light.bedroom", domain=LIGHT_DOMAIN)
-        mock_registry.async_get = lambda eid: mock_entry if eid == "light.bedroom" else None
+        # Registry entries only (no states), so only the registry lookup keeps a key
+        fake_registry.async_get = {"light.bedroom": _FakeEntry("light.bedroom")}.get
 
-        with patch(
-            "homeassistant.helpers.entity_registry.async_get",
-            return_value=mock_registry,
-        ):
-            await coordinator.async_prune_stale_storage()
+        await coordinator.async_prune_stale_storage()
 
         assert "light.bedroom" in coordinator.data
         assert "event.kitchen_input_1" not in coordinator.data
         assert "sensor.temperature" not in coordinator.data
         coordinator.store.async_save.assert_called_once()  # type: ignore[union-attr]
 
-    async def test_keeps_valid_light_entities(self, hass: HomeAssistant) -> None:
+    async def test_keeps_valid_light_entities(
+        self, hass: HomeAssistant, fake_registry: SimpleNamespace
+    ) -> None:
         """Test that valid light entities are kept in storage."""
         coordinator = _make_coordinator(
             hass,
@@ -576,39 +728,42 @@ class TestPruneStaleStorage:
             },
         )
 
-        mock_registry = MagicMock()
-        mock_entries = {
-            "light.bedroom": MagicMock(entity_id="light.bedroom"),
-            "light.kitchen": MagicMock(entity_id="light.kitchen"),
-        }
-        mock_registry.async_get = lambda eid: mock_entries.get(eid)
+        fake_registry.async_get = {
+            "light.bedroom": _FakeEntry("light.bedroom"),
+            "light.kitchen": _FakeEntry("light.kitchen"),
+        }.get
 
-        with patch(
-            "homeassistant.helpers.entity_registry.async_get",
-            return_value=mock_registry,
-        ):
-            await coordinator.async_prune_stale_storage()
+        await coordinator.async_prune_stale_storage()
 
         assert "light.bedroom" in coordinator.data
         assert "light.kitchen" in coordinator.data
         coordinator.store.async_save.assert_not_called()  # type: ignore[union-attr]
+        # Nothing changed, so the cached unconfigured-lights result stays valid
+        assert coordinator.data_revision == 0
 
 
 class TestSaveConfigNotification:
     """Test notification after saving config."""
 
-    async def test_notifies_after_save(self, hass: HomeAssistant) -> None:
+    async def test_notifies_after_save(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test notification check is called after saving config."""
         from custom_components.fado.websocket_api import async_save_light_config
 
         _make_coordinator(hass)
+        checks: list[HomeAssistant] = []
+
+        async def _record(hass: HomeAssistant) -> None:
+            checks.append(hass)
 
-        with patch(
-            "custom_components.fado.websocket_api._notify_unconfigured_lights"
-        ) as mock_notify:
-            await async_save_light_config(hass, "light.bedroom", min_delay_ms=100)
+        monkeypatch.setattr(
+            "custom_components.fado.websocket_api._notify_unconfigured_lights", _record
+        )
 
-        mock_notify.assert_called_once_with(hass)
+        await async_save_light_config(hass, "light.bedroom", min_delay_ms=100)
+
+        assert checks == [hass]
 
 
 class TestNotificationLinkUrl:
@@ -664,13 +819,45 @@ class TestNotificationLinkUrl:
         """Test returns /fado when no config entry exists."""
         assert _get_notification_link_url(hass) == "/fado"
 
+    def test_uses_cached_coordinator_options(
+        self, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the coordinator's cached options are used until invalidated."""
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                OPTION_SHOW_SIDEBAR: False,
+                OPTION_DASHBOARD_URL: "/lovelace-fado/0",
+            },
+        )
+        entry.add_to_hass(hass)
+        coordinator = _make_coordinator(hass)
+        coordinator.options = FadoOptions(entry)
+
+        assert _get_notification_link_url(hass) == "/lovelace-fado/0"
+
+        hass.config_entries.async_update_entry(
+            entry, options={OPTION_SHOW_SIDEBAR: False, OPTION_DASHBOARD_URL: "/other"}
+        )
+        lookups = _record_entry_lookups(hass, monkeypatch)
+        assert _get_notification_link_url(hass) == "/lovelace-fado/0"
+        assert lookups == []
+
+        coordinator.options.invalidate()
+        assert _get_notification_link_url(hass) == "/other"
+
 
 class TestNotificationsDisabled:
     """Test notifications can be disabled via options."""
 
-    async def test_disabled_notifications_dismisses(self, hass: HomeAssistant) -> None:
+    async def test_disabled_notifications_dismisses(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test disabled notifications dismisses any existing notification."""
-        _make_coordinator(hass)
+        coordinator = _make_coordinator(hass)
 
         entry = MockConfigEntry(
             domain=DOMAIN,
@@ -678,28 +865,46 @@ class TestNotificationsDisabled:
         )
         entry.add_to_hass(hass)
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
-
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_dismiss"
-            ) as mock_dismiss,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+        fake_registry.entities = MagicMock()
+
+        await _notify_unconfigured_lights(hass)
 
         # Should dismiss, not create
-        mock_create.assert_not_called()
-        mock_dismiss.assert_called_once_with(hass, NOTIFICATION_ID)
+        assert notifications.created == []
+        assert notifications.dismissed == [NOTIFICATION_ID]
+        # Should not scan the registry when the result would be discarded
+        fake_registry.entities.values.assert_not_called()
+        assert coordinator.unconfigured_cache is None
+
+    async def test_uses_coordinator_entry(
+        self,
+        hass: HomeAssistant,
+        monkeypatch: pytest.MonkeyPatch,
+        notifications: SimpleNamespace,
+    ) -> None:
+        """Test the options check reads the coordinator's entry, not async_entries."""
+        coordinator = _make_coordinator(hass)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            options={OPTION_NOTIFICATIONS_ENABLED: False},
+        )
+        entry.add_to_hass(hass)
+        coordinator.options = FadoOptions(entry)
+
+        lookups = _record_entry_lookups(hass, monkeypatch)
 
-    async def test_sidebar_disabled_uses_dashboard_url(self, hass: HomeAssistant) -> None:
+        await _notify_unconfigured_lights(hass)
+
+        assert notifications.dismissed == [NOTIFICATION_ID]
+        assert lookups == []
+
+    async def test_sidebar_disabled_uses_dashboard_url(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test notification uses dashboard URL when sidebar is disabled."""
         _make_coordinator(hass)
 
@@ -713,26 +918,20 @@ class TestNotificationsDisabled:
         )
         entry.add_to_hass(hass)
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
-
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
-
-        mock_create.assert_called_once()
-        call_args = mock_create.call_args
-        assert "/lovelace-fado/0" in call_args[0][1]
-        assert "/fado" not in call_args[0][1]
-
-    async def test_sidebar_disabled_no_url_no_link(self, hass: HomeAssistant) -> None:
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+
+        await _notify_unconfigured_lights(hass)
+
+        assert len(notifications.created) == 1
+        assert "/lovelace-fado/0" in notifications.created[0]
+        assert "/fado" not in notifications.created[0]
+
+    async def test_sidebar_disabled_no_url_no_link(
+        self,
+        hass: HomeAssistant,
+        fake_registry: SimpleNamespace,
+        notifications: SimpleNamespace,
+    ) -> None:
         """Test notification has no link when sidebar disabled and no dashboard URL."""
         _make_coordinator(hass)
 
@@ -745,22 +944,11 @@ class TestNotificationsDisabled:
         )
         entry.add_to_hass(hass)
 
-        mock_entry = MagicMock()
-        mock_entry.entity_id = "light.bedroom"
-        mock_entry.domain = LIGHT_DOMAIN
-        mock_entry.disabled = False
-
-        with (
-            patch("custom_components.fado.notifications.er.async_get") as mock_er,
-            patch(
-                "custom_components.fado.notifications.persistent_notification.async_create"
-            ) as mock_create,
-        ):
-            mock_er.return_value.entities.values.return_value = [mock_entry]
-            await _notify_unconfigured_lights(hass)
-
-        mock_create.assert_called_once()
-        call_args = mock_create.call_args
+        _register_lights(hass, fake_registry, [_FakeEntry("light.bedroom")])
+
+        await _notify_unconfigured_lights(hass)
+
+        assert len(notifications.created) == 1
         # Should have base message without any link
-        assert "Configure now" not in call_args[0][1]
-        assert "1 light" in call_args[0][1]
+        assert "Configure now" not in notifications.created[0]
+        assert "1 light" in notifications.created[0]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import pytest
 from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_SUPPORTED_COLOR_MODES
 from homeassistant.components.light import ATTR_COLOR_TEMP_KELVIN as HA_ATTR_COLOR_TEMP_KELVIN
 from homeassistant.components.light import ATTR_HS_COLOR as HA_ATTR_HS_COLOR
 from homeassistant.components.light.const import ColorMode
 
-from custom_components.fado.fade_change import FadeChange
+from custom_components.fado.fade_change import FadeChange, _build_from_step
 from custom_components.fado.fade_params import FadeParams
 
 
@@ -54,39 +55,37 @@ class TestResolveFadeBasicStructure:
 class TestResolveFadeSimpleBrightnessFade:
     """Test simple brightness-only fade scenarios."""
 
-    def test_brightness_fade_values(self) -> None:
-        """Test that brightness values are correctly resolved."""
-        params = FadeParams(brightness_pct=75, transition_ms=1000)
-        state = {
-            ATTR_BRIGHTNESS: 100,
-            ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS],
-        }
-
-        change = FadeChange.resolve(params, state, min_step_delay_ms=100)
-
-        assert change is not None
-        assert change.start_brightness == 100
-        # 75% of 255 = 191
-        assert change.end_brightness == 191
-
-    def test_brightness_fade_from_override(self) -> None:
-        """Test that from_brightness_pct overrides state brightness."""
-        params = FadeParams(
-            brightness_pct=100,
-            from_brightness_pct=25,
-            transition_ms=1000,
-        )
-        state = {
-            ATTR_BRIGHTNESS: 200,
+    @pytest.mark.parametrize(
+        ("params", "state_brightness", "expected_start", "expected_end"),
+        [
+            # 75% of 255 = 191
+            pytest.param(
+                FadeParams(brightness_pct=75, transition_ms=1000), 100, 100, 191, id="from_state"
+            ),
+            # 25% of 255 = int(63.75) = 63, overriding state brightness
+            pytest.param(
+                FadeParams(brightness_pct=100, from_brightness_pct=25, transition_ms=1000),
+                200,
+                63,
+                255,
+                id="from_override",
+            ),
+        ],
+    )
+    def test_brightness_fade_values(
+        self, params: FadeParams, state_brightness: int, expected_start: int, expected_end: int
+    ) -> None:
+        """Test that start brightness comes from state or from_brightness_pct."""
+        state = {
+            ATTR_BRIGHTNESS: state_brightness,
             ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS],
         }
 
         change = FadeChange.resolve(params, state, min_step_delay_ms=100)
 
         assert change is not None
-        # 25% of 255 = int(63.75) = 63
-        assert change.start_brightness == 63
-        assert change.end_brightness == 255
+        assert change.start_brightness == expected_start
+        assert change.end_brightness == expected_end
 
     def test_brightness_fade_no_color_attributes(self) -> None:
         """Test that brightness-only fade has no color attributes."""
@@ -108,40 +107,43 @@ class TestResolveFadeSimpleBrightnessFade:
 class TestResolveFadeSimpleHsFade:
     """Test simple HS color fade scenarios."""
 
-    def test_hs_color_fade_values(self) -> None:
-        """Test that HS color values are correctly resolved."""
-        params = FadeParams(
-            hs_color=(120.0, 80.0),
-            transition_ms=1000,
-        )
-        state = {
-            HA_ATTR_HS_COLOR: (60.0, 50.0),
-            ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS],
-        }
-
-        change = FadeChange.resolve(params, state, min_step_delay_ms=100)
-
-        assert change is not None
-        assert change.start_hs == (60.0, 50.0)
-        assert change.end_hs == (120.0, 80.0)
-
-    def test_hs_color_fade_from_override(self) -> None:
-        """Test that from_hs_color overrides state HS color."""
-        params = FadeParams(
-            hs_color=(240.0, 100.0),
-            from_hs_color=(0.0, 100.0),
-            transition_ms=1000,
-        )
-        state = {
-            HA_ATTR_HS_COLOR: (180.0, 50.0),
+    @pytest.mark.parametrize(
+        ("params", "state_hs", "expected_start", "expected_end"),
+        [
+            pytest.param(
+                FadeParams(hs_color=(120.0, 80.0), transition_ms=1000),
+                (60.0, 50.0),
+                (60.0, 50.0),
+                (120.0, 80.0),
+                id="from_state",
+            ),
+            pytest.param(
+                FadeParams(hs_color=(240.0, 100.0), from_hs_color=(0.0, 100.0), transition_ms=1000),
+                (180.0, 50.0),
+                (0.0, 100.0),
+                (240.0, 100.0),
+                id="from_override",
+            ),
+        ],
+    )
+    def test_hs_color_fade_values(
+        self,
+        params: FadeParams,
+        state_hs: tuple[float, float],
+        expected_start: tuple[float, float],
+        expected_end: tuple[float, float],
+    ) -> None:
+        """Test that start HS comes from state or from_hs_color."""
+        state = {
+            HA_ATTR_HS_COLOR: state_hs,
             ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS],
         }
 
         change = FadeChange.resolve(params, state, min_step_delay_ms=100)
 
         assert change is not None
-        assert change.start_hs == (0.0, 100.0)
-        assert change.end_hs == (240.0, 100.0)
+        assert change.start_hs == expected_start
+        assert change.end_hs == expected_end
 
     def test_hs_color_only_no_mireds(self) -> None:
         """Test that HS-only fade has no mireds attributes."""
@@ -164,40 +166,41 @@ class TestResolveFadeSimpleHsFade:
 class TestResolveFadeSimpleColorTempFade:
     """Test simple color temperature fade scenarios."""
 
-    def test_color_temp_fade_values(self) -> None:
-        """Test that color temp values are correctly converted to mireds."""
-        params = FadeParams(
-            color_temp_kelvin=2500,  # 400 mireds
-            transition_ms=1000,
-        )
-        state = {
-            HA_ATTR_COLOR_TEMP_KELVIN: 5000,  # 200 mireds
-            ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP],
-        }
-
-        change = FadeChange.resolve(params, state, min_step_delay_ms=100)
-
-        assert change is not None
-        assert change.start_mireds == 200
-        assert change.end_mireds == 400
-
-    def test_color_temp_fade_from_override(self) -> None:
-        """Test that from_color_temp_kelvin overrides state kelvin."""
-        params = FadeParams(
-            color_temp_kelvin=2000,  # 500 mireds
-            from_color_temp_kelvin=6500,  # 153 mireds (int(1_000_000/6500))
-            transition_ms=1000,
-        )
-        state = {
-            HA_ATTR_COLOR_TEMP_KELVIN: 3000,  # ~333 mireds
+    @pytest.mark.parametrize(
+        ("params", "state_kelvin", "expected_start", "expected_end"),
+        [
+            # 5000K = 200 mireds, 2500K = 400 mireds
+            pytest.param(
+                FadeParams(color_temp_kelvin=2500, transition_ms=1000),
+                5000,
+                200,
+                400,
+                id="from_state",
+            ),
+            # 6500K = int(1_000_000/6500) = 153 mireds, 2000K = 500 mireds
+            pytest.param(
+                FadeParams(color_temp_kelvin=2000, from_color_temp_kelvin=6500, transition_ms=1000),
+                3000,
+                153,
+                500,
+                id="from_override",
+            ),
+        ],
+    )
+    def test_color_temp_fade_values(
+        self, params: FadeParams, state_kelvin: int, expected_start: int, expected_end: int
+    ) -> None:
+        """Test that color temp values are converted to mireds from state or from override."""
+        state = {
+            HA_ATTR_COLOR_TEMP_KELVIN: state_kelvin,
             ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP],
         }
 
         change = FadeChange.resolve(params, state, min_step_delay_ms=100)
 
         assert change is not None
-        assert change.start_mireds == 153
-        assert change.end_mireds == 500
+        assert change.start_mireds == expected_start
+        assert change.end_mireds == expected_end
 
     def test_color_temp_only_no_hs(self) -> None:
         """Test that color temp only fade has no HS attributes."""
@@ -355,8 +358,7 @@ class TestResolveFadeHybridStepGeneration:
         # Iterate through all steps
         steps_with_hs = 0
         steps_with_kelvin = 0
-        while change.has_next():
-            step = change.next_step()
+        for step in change:
             if step.hs_color is not None:
                 steps_with_hs += 1
             if step.color_temp_kelvin is not None:
@@ -405,8 +407,7 @@ class TestResolveFadeHybridStepGeneration:
         # Iterate through all steps
         steps_with_hs = 0
         steps_with_kelvin = 0
-        while change.has_next():
-            step = change.next_step()
+        for step in change:
             if step.hs_color is not None:
                 steps_with_hs += 1
             if step.color_temp_kelvin is not None:
@@ -525,31 +526,26 @@ class TestResolveFadeCapabilityFiltering:
 class TestResolveFadeTimingParameters:
     """Test that timing parameters are correctly passed through."""
 
-    def test_transition_ms_passed_to_change(self) -> None:
-        """Test that transition_ms is passed to FadeChange."""
-        params = FadeParams(brightness_pct=50, transition_ms=2000)
+    @pytest.mark.parametrize(
+        ("transition_ms", "min_step_delay_ms"),
+        [
+            pytest.param(2000, 100, id="transition_ms"),
+            pytest.param(1000, 75, id="min_step_delay_ms"),
+        ],
+    )
+    def test_timing_passed_to_change(self, transition_ms: int, min_step_delay_ms: int) -> None:
+        """Test that transition_ms and min_step_delay_ms are passed to FadeChange."""
+        params = FadeParams(brightness_pct=50, transition_ms=transition_ms)
         state = {
             ATTR_BRIGHTNESS: 100,
             ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS],
         }
 
-        change = FadeChange.resolve(params, state, min_step_delay_ms=100)
+        change = FadeChange.resolve(params, state, min_step_delay_ms=min_step_delay_ms)
 
         assert change is not None
-        assert change.transition_ms == 2000
-
-    def test_min_step_delay_ms_passed_to_change(self) -> None:
-        """Test that min_step_delay_ms is passed to FadeChange."""
-        params = FadeParams(brightness_pct=50, transition_ms=1000)
-        state = {
-            ATTR_BRIGHTNESS: 100,
-            ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS],
-        }
-
-        change = FadeChange.resolve(params, state, min_step_delay_ms=75)
-
-        assert change is not None
-        assert change.min_step_delay_ms == 75
+        assert change.transition_ms == transition_ms
+        assert change.min_step_delay_ms == min_step_delay_ms
 
 
 class TestResolveFadeEdgeCases:
@@ -714,8 +710,6 @@ class TestBuildFromStep:
 
     def test_from_brightness_pct_differs_from_state(self) -> None:
         """Test building from step when brightness differs from state."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50, from_brightness_pct=50)
         state = {ATTR_BRIGHTNESS: 255}  # Actual differs from from (127)
         step = _build_from_step(params, state, min_brightness=1)
@@ -726,8 +720,6 @@ class TestBuildFromStep:
 
     def test_from_brightness_pct_matches_state_returns_none(self) -> None:
         """Test that from step is None when brightness matches state."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50, from_brightness_pct=50)
         state = {ATTR_BRIGHTNESS: 127}  # Actual matches from (127)
         step = _build_from_step(params, state, min_brightness=1)
@@ -735,8 +727,6 @@ class TestBuildFromStep:
 
     def test_from_brightness_raw(self) -> None:
         """Test building from step with raw brightness."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50, from_brightness=200)
         state = {ATTR_BRIGHTNESS: 100}
         step = _build_from_step(params, state, min_brightness=1)
@@ -745,8 +735,6 @@ class TestBuildFromStep:
 
     def test_from_brightness_clamped_to_min(self) -> None:
         """Test that from brightness is clamped to min_brightness."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50, from_brightness=3)
         state = {ATTR_BRIGHTNESS: 100}
         step = _build_from_step(params, state, min_brightness=10)
@@ -755,8 +743,6 @@ class TestBuildFromStep:
 
     def test_from_hs_color_different_color_space(self) -> None:
         """Test from HS color when light is in COLOR_TEMP mode (always applies)."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(hs_color=(120.0, 100.0), from_hs_color=(120.0, 100.0))
         state = {"color_mode": ColorMode.COLOR_TEMP}
         step = _build_from_step(params, state, min_brightness=1)
@@ -766,8 +752,6 @@ class TestBuildFromStep:
 
     def test_from_hs_color_same_color_space_differs(self) -> None:
         """Test from HS color when light is in HS mode with different color."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(hs_color=(120.0, 100.0), from_hs_color=(120.0, 100.0))
         state = {"color_mode": ColorMode.HS, HA_ATTR_HS_COLOR: (0.0, 50.0)}
         step = _build_from_step(params, state, min_brightness=1)
@@ -776,8 +760,6 @@ class TestBuildFromStep:
 
     def test_from_hs_color_same_color_space_matches(self) -> None:
         """Test from HS color when light already has same HS → None."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(hs_color=(120.0, 100.0), from_hs_color=(120.0, 100.0))
         state = {"color_mode": ColorMode.HS, HA_ATTR_HS_COLOR: (120.0, 100.0)}
         step = _build_from_step(params, state, min_brightness=1)
@@ -785,8 +767,6 @@ class TestBuildFromStep:
 
     def test_from_color_temp_different_color_space(self) -> None:
         """Test from color_temp when light is in HS mode (always applies)."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(color_temp_kelvin=3000, from_color_temp_kelvin=3000)
         state = {"color_mode": ColorMode.HS}
         step = _build_from_step(params, state, min_brightness=1)
@@ -795,8 +775,6 @@ class TestBuildFromStep:
 
     def test_from_color_temp_same_color_space_matches(self) -> None:
         """Test from color_temp when light already at same temp → None."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(color_temp_kelvin=3000, from_color_temp_kelvin=3000)
         state = {"color_mode": ColorMode.COLOR_TEMP, HA_ATTR_COLOR_TEMP_KELVIN: 3000}
         step = _build_from_step(params, state, min_brightness=1)
@@ -804,8 +782,6 @@ class TestBuildFromStep:
 
     def test_no_from_values_returns_none(self) -> None:
         """Test that no from values returns None."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50)
         state = {ATTR_BRIGHTNESS: 100}
         step = _build_from_step(params, state, min_brightness=1)
@@ -813,8 +789,6 @@ class TestBuildFromStep:
 
     def test_from_brightness_pct_one_uses_min_brightness(self) -> None:
         """Test that brightness_pct=1 uses min_brightness when higher."""
-        from custom_components.fado.fade_change import _build_from_step
-
         params = FadeParams(brightness_pct=50, from_brightness_pct=1)
         state = {ATTR_BRIGHTNESS: 100}
         # 1% of 255 = 2, but min_brightness is 10
@@ -839,13 +813,10 @@ class TestResolveFadeFadeChangeIterator:
         assert change is not None
         assert change.step_count() >= 1
 
-        total_steps = 0
-        while change.has_next():
-            step = change.next_step()
-            assert step is not None
-            total_steps += 1
+        steps = list(change)
 
-        assert total_steps == change.step_count()
+        assert all(step is not None for step in steps)
+        assert len(steps) == change.step_count()
 
     def test_hybrid_change_generates_steps(self) -> None:
         """Test that hybrid FadeChange can generate steps."""
@@ -862,11 +833,8 @@ class TestResolveFadeFadeChangeIterator:
 
         assert change is not None
 
-        total_steps = 0
-        while change.has_next():
-            step = change.next_step()
-            assert step is not None
-            total_steps += 1
+        steps = list(change)
 
-        assert total_steps > 0
-        assert total_steps == change.step_count()
+        assert steps
+        assert all(step is not None for step in steps)
+        assert len(steps) == change.step_count()
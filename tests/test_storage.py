@@ -1,6 +1,7 @@
 """Tests for storage helpers."""
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,8 +15,6 @@ from custom_components.fado.expected_state import ExpectedState, ExpectedValues
 @pytest.fixture
 def hass_with_storage(hass: HomeAssistant) -> HomeAssistant:
     """Set up hass with storage data via FadeCoordinator."""
-    mock_store = MagicMock()
-    mock_store.async_save = AsyncMock()
     storage_data = {
         "light.bedroom": {
             "orig_brightness": 200,
@@ -28,7 +27,7 @@ def hass_with_storage(hass: HomeAssistant) -> HomeAssistant:
     }
     coordinator = FadeCoordinator(
         hass=hass,
-        store=mock_store,
+        store=SimpleNamespace(async_save=AsyncMock()),  # type: ignore[arg-type]
         min_step_delay_ms=100,
     )
     coordinator.data = storage_data
@@ -111,8 +110,6 @@ class TestCleanupEntityData:
     @pytest.fixture
     def hass_with_full_state(self, hass: HomeAssistant) -> HomeAssistant:
         """Set up hass with storage data."""
-        mock_store = MagicMock()
-        mock_store.async_save = AsyncMock()
         storage_data = {
             "light.test": {
                 "orig_brightness": 200,
@@ -125,7 +122,7 @@ class TestCleanupEntityData:
         }
         coordinator = FadeCoordinator(
             hass=hass,
-            store=mock_store,
+            store=SimpleNamespace(async_save=AsyncMock()),  # type: ignore[arg-type]
             min_step_delay_ms=100,
         )
         coordinator.data = storage_data
@@ -218,11 +215,9 @@ class TestCleanupEntityData:
 
     async def test_cleanup_handles_missing_entity(self, hass: HomeAssistant) -> None:
         """Test that cleanup handles entity not in any data structures."""
-        mock_store = MagicMock()
-        mock_store.async_save = AsyncMock()
         coordinator = FadeCoordinator(
             hass=hass,
-            store=mock_store,
+            store=SimpleNamespace(async_save=AsyncMock()),  # type: ignore[arg-type]
             min_step_delay_ms=100,
         )
         hass.data[DOMAIN] = coordinator
@@ -510,6 +510,31 @@ async def test_save_settings_updates_min_delay(hass: HomeAssistant, init_integra
     assert entry.options.get(OPTION_MIN_STEP_DELAY_MS) == 200
 
 
+async def test_save_settings_invalidates_cached_options(
+    hass: HomeAssistant, hass_ws_client, init_integration
+) -> None:
+    """Test save_settings drops cached option values so they follow the updated entry."""
+    from custom_components.fado.const import OPTION_DASHBOARD_URL, OPTION_SHOW_SIDEBAR
+
+    coordinator = hass.data[DOMAIN]
+    assert coordinator.options.link_url == "/fado"
+
+    # Change options in place (no reload); the cached link is now stale
+    hass.config_entries.async_update_entry(
+        init_integration,
+        options={OPTION_SHOW_SIDEBAR: False, OPTION_DASHBOARD_URL: "/lovelace-fado/0"},
+    )
+    assert coordinator.options.link_url == "/fado"
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "fado/save_settings", "default_min_delay_ms": 150})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert coordinator.min_step_delay_ms == 150
+    assert coordinator.options.link_url == "/lovelace-fado/0"
+
+
 async def test_apply_log_level(hass: HomeAssistant, init_integration) -> None:
     """Test _apply_log_level calls logger service."""
 